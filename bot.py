@@ -6,7 +6,7 @@ from aiotg import Bot, Chat
 import db
 import settings
 from exchanges import get_api_by_name, get_supported_info
-from order_checker import OrderChecker
+from order_checker import OrderChecker, fetch_orders, order_rows
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(settings.BOT_NAME)
@@ -16,7 +16,7 @@ bot = Bot(api_token=settings.BOT_TOKEN)
 
 async def run_loop():
     # send updates
-    checker = OrderChecker()
+    checker = OrderChecker(settings.CHECK_EXCHANGE_IDS)
     await checker.check()
     asyncio.ensure_future(checker.periodic(), loop=loop)
     await bot.loop()
@@ -25,7 +25,7 @@ async def run_loop():
 @bot.command(r'(/start|/help)')
 async def start(chat: Chat, match):
     await chat.send_text(
-        'Hello! I can notify you about your closed orders on next exchanges:\n'
+        'Hello! I can notify you about your closed and partially filled orders on next exchanges:\n'
         f'{get_supported_info()}\n'
         'Just send command like `/sub exchange_name api_key secret_key` (keys with read only permissions) '
         'to subscribe order notifications and `/unsub exchange_name` to unsubscribe.',
@@ -72,6 +72,10 @@ async def subscribe(chat: Chat, match):
     exchange_api = exchange_cls(api, secret)
     order_history = await exchange_api.order_history()
     await db.add_orders((uid, exchange_cls.api_id, order_id) for order_id in order_history)
+    # open orders are tracked since subscription, orders in history are not notified
+    open_orders = sorted(await exchange_api.open_orders())
+    async for orders in fetch_orders(exchange_api, uid, open_orders):
+        await db.save_orders_state(order_rows(uid, orders))
 
     await db.subscribe(uid, exchange_cls.api_id, api, secret)
     await chat.send_text(f'You are subscribed to {exchange_name!r}.')
@@ -1,7 +1,10 @@
 import asyncpg
 
 import settings
-from exchanges import exchange_apis
+from exchanges import exchange_specs
+from exchanges.base import State, final_states
+
+pending_states = [state.value for state in State if state not in final_states]
 
 pool = None  # asyncpg connection pool
 
@@ -32,6 +35,15 @@ async def create_tables():
                 PRIMARY KEY (uid, exchange_id, order_id))'''
         )
 
+        # last known state of tracked orders. NULL for orders known at subscription time and for rows
+        # created before the column: they are treated as notified, open ones get tracked by the checker
+        await conn.fetch('''ALTER TABLE user_order ADD COLUMN IF NOT EXISTS state SMALLINT''')
+        await conn.fetch('''ALTER TABLE user_order ADD COLUMN IF NOT EXISTS executed DOUBLE PRECISION''')
+        await conn.fetch(
+            f'''CREATE INDEX IF NOT EXISTS user_order_pending_idx ON user_order (exchange_id, uid)
+                WHERE state IN ({', '.join(map(str, pending_states))})'''
+        )
+
 
 async def init_db():
     global pool
@@ -41,7 +53,7 @@ async def init_db():
 
 
 async def insert_initial_values():
-    exchanges = ((api.api_id, api.name, api.url) for api in exchange_apis)
+    exchanges = ((spec.api_id, spec.name, spec.url) for spec in exchange_specs())
     async with pool.acquire() as conn:
         await conn.executemany(
             '''INSERT INTO exchange (id, name, url) 
@@ -118,6 +130,29 @@ async def get_order_ids(exchange_id, uid):
         return {row['order_id'] for row in rows}
 
 
+async def get_pending_orders(exchange_id, uid):
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            f'''SELECT order_id, state, executed FROM user_order 
+                WHERE exchange_id = $1 AND uid = $2 AND state IN ({', '.join(map(str, pending_states))})''',
+            exchange_id,
+            uid
+        )
+        return {row['order_id']: (State(row['state']), row['executed']) for row in rows}
+
+
+async def save_orders_state(orders):
+    async with pool.acquire() as conn:
+        await conn.executemany(
+            '''INSERT INTO user_order (uid, exchange_id, order_id, state, executed) 
+               VALUES ($1, $2, $3, $4, $5)
+               ON CONFLICT (uid, exchange_id, order_id) DO UPDATE SET 
+                state = $4,
+                executed = $5''',
+            orders
+        )
+
+
 async def get_uids():
     async with pool.acquire() as conn:
         rows = await conn.fetch(
@@ -1,18 +1,90 @@
-from exchanges.bittrex import BittrexApi
-from exchanges.kraken import KrakenApi
-from exchanges.liqui import LiquiApi
+from importlib import import_module
+from logging import getLogger
 
-exchange_apis = [LiquiApi, BittrexApi, KrakenApi]
+PLUGINS_GROUP = 'orders_notify.exchanges'
+
+
+class ExchangeSpec:
+    '''Exchange metadata, the api class is imported on first `load()`.'''
+
+    __slots__ = ('name', 'api_id', 'url', 'path', '_api')
+
+    def __init__(self, name, api_id, url, path=None, api=None):
+        self.name = name
+        self.api_id = api_id
+        self.url = url
+        self.path = path  # 'package.module:ClassName'
+        self._api = api
+
+    def load(self):
+        if self._api is None:
+            module_name, _, cls_name = self.path.partition(':')
+            api = getattr(import_module(module_name), cls_name)
+            if (api.name, api.api_id, api.url) != (self.name, self.api_id, self.url):
+                raise ValueError(f'Exchange {self.name!r} with id {self.api_id} does not match '
+                                 f'{api.__name__} ({api.name!r} with id {api.api_id}).')
+            self._api = api
+        return self._api
+
+
+_by_name = {}
+_by_id = {}
+_supported_info = None
+
+
+def register(spec: ExchangeSpec):
+    global _supported_info
+    if spec.name in _by_name or spec.api_id in _by_id:
+        raise ValueError(f'Exchange {spec.name!r} with id {spec.api_id} is already registered.')
+    _by_name[spec.name] = _by_id[spec.api_id] = spec
+    _supported_info = None
+
+
+def register_api(api):
+    register(ExchangeSpec(api.name, api.api_id, api.url, api=api))
+
+
+def load_plugins():
+    '''Registers exchange apis exposed by installed packages under the `orders_notify.exchanges` entry point group.
+
+    Unlike the built-in exchanges, plugins are imported here, their name, id and url are read from the api class.
+    '''
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # python < 3.8
+        return
+    eps = entry_points()
+    group = eps.select(group=PLUGINS_GROUP) if hasattr(eps, 'select') else eps.get(PLUGINS_GROUP, ())
+    for ep in group:
+        try:
+            register_api(ep.load())
+        except Exception as e:
+            getLogger().error(f'Error while loading exchange plugin {ep.name!r}, skipping...')
+            getLogger().exception(e)
+
+
+def exchange_specs():
+    return _by_id.values()
 
 
 def get_api_by_name(exchange_name):
-    for api in exchange_apis:
-        if api.name == exchange_name:
-            return api
+    spec = _by_name.get(exchange_name)
+    return spec.load() if spec else None
+
+
+def get_api_by_id(api_id):
+    spec = _by_id.get(api_id)
+    return spec.load() if spec else None
 
 
 def get_supported_info():
-    apis_info = []
-    for api in exchange_apis:
-        apis_info.append(f'[{api.name}]({api.url})')
-    return '\n'.join(apis_info)
+    global _supported_info
+    if _supported_info is None:
+        _supported_info = '\n'.join(f'[{spec.name}]({spec.url})' for spec in _by_id.values())
+    return _supported_info
+
+
+register(ExchangeSpec('liqui', 1, 'https://liqui.io/', 'exchanges.liqui:LiquiApi'))
+register(ExchangeSpec('bittrex', 2, 'https://bittrex.com/', 'exchanges.bittrex:BittrexApi'))
+register(ExchangeSpec('kraken', 3, 'https://www.kraken.com/', 'exchanges.kraken:KrakenApi'))
+load_plugins()
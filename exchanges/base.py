@@ -8,9 +8,11 @@ import aiohttp
 from aiohttp import ClientSession
 
 from exchanges.exceptions import WrongContentTypeException, BaseExchangeException, InvalidResponseException
-from settings import REQUEST_ATTEMPTS_LIMIT
+from exchanges.replay import Recorder
+from settings import REQUEST_ATTEMPTS_LIMIT, RECORD_DIR
 
-Order = namedtuple('Order', 'exchange_id order_id type pair price amount state')
+Order = namedtuple('Order', 'exchange_id order_id type pair price amount state executed')
+Order.__new__.__defaults__ = (0,)  # executed
 
 
 class State(Enum):
@@ -29,6 +31,8 @@ state_text = {
     State.EXPIRED: '⏱ expired',
 }
 
+final_states = frozenset((State.EXECUTED, State.CANCELED, State.CANCELED_PARTIALLY_FILLED, State.EXPIRED))
+
 
 class BaseApi(ABC):
     name = None
@@ -36,6 +40,9 @@ class BaseApi(ABC):
     url = None
     api_regex = None
     secret_regex = None
+    order_info_batch_size = 1  # max orders fetched by one `orders_info` call
+    recorder = Recorder(RECORD_DIR) if RECORD_DIR else None
+    transport = None  # replaces network requests if set, e.g. by exchanges.replay.ReplayTransport
 
     def __init__(self, key, secret):
         self._key = key
@@ -46,6 +53,11 @@ class BaseApi(ABC):
         return cls.api_regex.match(api) and cls.secret_regex.match(secret)
 
     async def request(self, url, headers, method='get', data=None):
+        if self.transport is not None:
+            json_resp = await self.transport.request(self.name, method, url, data)
+            self._raise_if_error(json_resp)
+            return json_resp
+
         attempt, delay = 1, 1
         async with ClientSession() as s:
             session_method = s.__getattribute__(method.lower())
@@ -56,6 +68,8 @@ class BaseApi(ABC):
                         raise WrongContentTypeException(f'Unexpected content type {resp.content_type!r} at URL {url}.')
                     json_resp = await resp.json()
                     self._raise_if_error(json_resp)
+                    if self.recorder is not None:  # error responses are retried, not recorded
+                        await self.recorder.write(self.name, method, url, data, json_resp)
                     return json_resp
                 except (aiohttp.client_exceptions.ClientResponseError, BaseExchangeException) as e:
                     getLogger().error(f'attempt {attempt}/{REQUEST_ATTEMPTS_LIMIT}, next in {delay} seconds...')
@@ -80,13 +94,23 @@ class BaseApi(ABC):
     async def order_info(self, order_id: str) -> Order:
         '''Returns order info by order id.'''
 
+    async def open_orders(self) -> [str, ]:
+        '''Returns user open orders ids, their fills are tracked without notifying about placement. Empty by default.'''
+        return set()
+
+    async def orders_info(self, order_ids: [str, ]) -> [Order, ]:
+        '''Returns orders info by orders ids, at most `order_info_batch_size` ids.'''
+        return [await self.order_info(order_id) for order_id in order_ids]
+
     def format_order(self, order: Order):
         ticker_url = f'[{order.pair}]({self._get_ticker_url(order.pair)})'
+        executed = f'*Executed:* {order.executed:.8f}\n' if 0 < order.executed < order.amount else ''
         return f'*Exchange:* {self.name}\n' \
                f'*Pair:* {ticker_url}\n' \
                f'*Type:* {order.type}\n' \
                f'*Price:* {order.price:.8f}\n' \
                f'*Amount:* {order.amount:.8f}\n' \
+               f'{executed}' \
                f'*State:* {state_text[order.state]}'
 
     @abstractmethod
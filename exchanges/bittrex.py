@@ -31,6 +31,12 @@ class BittrexApi(BaseApi):
             raise BittrexApiException(resp['message'])
         return {order['OrderUuid'] for order in resp['result']}
 
+    async def open_orders(self):
+        method_url = 'https://bittrex.com/api/v1.1/market/getopenorders'
+        headers, url = self.get_headers_url(method_url)
+        resp = await self.get(url, headers)
+        return {order['OrderUuid'] for order in resp['result']}
+
     async def order_info(self, order_id: str) -> dict:
         method_url = 'https://bittrex.com/api/v1.1/account/getorder'
         params = {'uuid': order_id}
@@ -44,7 +50,8 @@ class BittrexApi(BaseApi):
             order['Exchange'],
             order['PricePerUnit'] or order['Limit'],
             order['Quantity'],
-            self._order_state(order)
+            self._order_state(order),
+            order['Quantity'] - order['QuantityRemaining'],
         )
 
     @staticmethod
@@ -52,7 +59,7 @@ class BittrexApi(BaseApi):
         is_open, canceled = order['Closed'] is None, order['CancelInitiated']
         qty, qty_remaining = order['Quantity'], order['QuantityRemaining']
 
-        if is_open and qty == qty_remaining:
+        if is_open:  # partial fills are reported by Order.executed
             return State.ACTIVE
         if not is_open and not canceled and not qty_remaining:
             return State.EXECUTED
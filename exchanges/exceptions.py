@@ -8,3 +8,7 @@ class InvalidResponseException(BaseExchangeException):
 
 class WrongContentTypeException(BaseExchangeException):
     pass
+
+
+class NotRecordedException(BaseExchangeException):
+    pass
@@ -22,12 +22,15 @@ class KrakenApi(BaseApi):
     secret_regex = re.compile(r'^[a-zA-Z0-9/+]{86}==$')
 
     BASE_URL = 'https://api.kraken.com'
+    order_info_batch_size = 20  # QueryOrders accepts up to 50 txids
+    _pairs = {}  # kraken pair name: parsed pair, shared by instances
 
     @staticmethod
     def _order_state(order: dict) -> State:
         if order['status'] == 'canceled' and float(order['vol_exec']) > 0:
             return State.CANCELED_PARTIALLY_FILLED
         return {
+            'pending': State.ACTIVE,
             'open': State.ACTIVE,
             'canceled': State.CANCELED,
             'closed': State.EXECUTED,
@@ -39,25 +42,37 @@ class KrakenApi(BaseApi):
         data, headers = self._get_headers(method_url)
         resp = await self.post(self.BASE_URL + method_url, headers, data)
 
-        return {order_id for order_id in resp['result']['closed']}
+        return set(resp['result']['closed'])
+
+    async def open_orders(self) -> [str, ]:
+        method_url = '/0/private/OpenOrders'
+        data, headers = self._get_headers(method_url)
+        resp = await self.post(self.BASE_URL + method_url, headers, data)
+
+        return set(resp['result']['open'])
 
     async def order_info(self, order_id: str) -> Order:
+        return (await self.orders_info([order_id]))[0]
+
+    async def orders_info(self, order_ids: [str, ]) -> [Order, ]:
         method_url = '/0/private/QueryOrders'
-        data, headers = self._get_headers(method_url, {'txid': order_id})
+        data, headers = self._get_headers(method_url, {'txid': ','.join(order_ids)})
         resp = await self.post(self.BASE_URL + method_url, headers, data)
 
-        order = resp['result'][order_id]
-        descr = order['descr']
-
-        return Order(
-            self.api_id,
-            order_id,
-            descr['type'],
-            await self._parse_pair(descr['pair']),
-            descr['price'],
-            order['vol'],
-            self._order_state(order),
-        )
+        orders = []
+        for order_id, order in resp['result'].items():
+            descr = order['descr']
+            orders.append(Order(
+                self.api_id,
+                order_id,
+                descr['type'],
+                await self._parse_pair(descr['pair']),
+                float(descr['price']),
+                float(order['vol']),
+                self._order_state(order),
+                float(order['vol_exec']),
+            ))
+        return orders
 
     def _get_ticker_url(self, pair):
         return 'https://www.kraken.com/charts'  # there is no more exact link ¯\_(ツ)_/¯
@@ -84,6 +99,11 @@ class KrakenApi(BaseApi):
         return sigdigest.decode()
 
     async def _parse_pair(self, pair):
+        if pair not in self._pairs:
+            self._pairs[pair] = await self._fetch_pair(pair)
+        return self._pairs[pair]
+
+    async def _fetch_pair(self, pair):
         url = f'https://api.kraken.com/0/public/AssetPairs?pair={pair}'
         resp = await self.get(url)
         result = resp['result']
@@ -12,10 +12,6 @@ class LiquiApiException(BaseExchangeException):
     pass
 
 
-class NoOrdersException(BaseExchangeException):
-    pass
-
-
 class LiquiApi(BaseApi):
     name = 'liqui'
     api_id = 1
@@ -27,6 +23,9 @@ class LiquiApi(BaseApi):
         history = await self._tapi(method='TradeHistory')
         return {str(info['order_id']) for _, info in history.items()}
 
+    async def open_orders(self) -> [str, ]:
+        return set(await self._tapi(method='ActiveOrders'))
+
     async def order_info(self, order_id: str) -> Order:
         order = (await self._tapi(method='OrderInfo', order_id=order_id))[order_id]
         return Order(
@@ -37,6 +36,7 @@ class LiquiApi(BaseApi):
             order['rate'],
             order['start_amount'],
             self._order_state(order),
+            order['start_amount'] - order['amount'],
         )
 
     @staticmethod
@@ -54,6 +54,8 @@ class LiquiApi(BaseApi):
             headers={'Key': self._key, 'Sign': self._sign(params)},
             data=params
         )
+        if resp.get('error') == 'no orders':
+            return {}
         return resp.get('return', resp)
 
     def _sign(self, data):
@@ -62,7 +64,5 @@ class LiquiApi(BaseApi):
         return hmac.new(self._secret.encode(), data.encode(), hashlib.sha512).hexdigest()
 
     def _raise_if_error(self, response: dict):
-        if 'error' in response:
-            if response['error'] == 'no orders':
-                raise NoOrdersException(response['error'])
+        if 'error' in response and response['error'] != 'no orders':
             raise LiquiApiException(response['error'])
@@ -0,0 +1,110 @@
+import asyncio
+import atexit
+import gzip
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from exchanges.exceptions import NotRecordedException
+
+REDACTED = '***'
+DROPPED_PARAMS = {'nonce'}
+SECRET_PARAMS = {'apikey'}
+
+
+def _redact_params(params) -> dict:
+    return {
+        k: REDACTED if k in SECRET_PARAMS else v
+        for k, v in params if k not in DROPPED_PARAMS
+    }
+
+
+def redact(url: str, data: dict = None) -> (str, dict):
+    '''Drops nonces and masks credentials passed in request url and data.'''
+    parts = urlsplit(url)
+    query = urlencode(_redact_params(parse_qsl(parts.query)))
+    return urlunsplit(parts._replace(query=query)), _redact_params((data or {}).items())
+
+
+def request_key(method: str, url: str, data: dict) -> str:
+    # order ids may come in any order, e.g. comma separated kraken txids
+    data = {k: ','.join(sorted(str(v).split(','))) for k, v in data.items()}
+    return json.dumps([method.lower(), url, data], sort_keys=True)
+
+
+class Recorder:
+    '''Appends exchange responses to gzipped JSON lines files, one per exchange.
+
+    Files are opened on first write and kept open, writes are made by a single thread out of the event loop.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._files = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)  # keeps writes ordered
+
+    async def write(self, exchange_name: str, method: str, url: str, data: dict, response: dict):
+        url, data = redact(url, data)
+        record = {'method': method.lower(), 'url': url, 'data': data, 'response': response}
+        line = json.dumps(record) + '\n'
+        await asyncio.get_event_loop().run_in_executor(self._executor, self._write, exchange_name, line)
+
+    def _write(self, exchange_name, line):
+        f = self._files.get(exchange_name)
+        if f is None:
+            if not self._files:
+                os.makedirs(self.path, exist_ok=True)
+                atexit.register(self.close)
+            f = self._files[exchange_name] = gzip.open(os.path.join(self.path, f'{exchange_name}.jsonl.gz'), 'at')
+        f.write(line)
+        f.flush()  # readable even if the process is killed
+
+    def close(self):
+        '''Waits for pending writes and closes the files, the recorder can not be used after.'''
+        self._executor.shutdown()
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+
+class ReplayTransport:
+    '''Answers api requests with responses written by `Recorder`, without network access.
+
+    Responses recorded several times for the same request are returned in turn.
+    '''
+
+    def __init__(self, path):
+        self._responses = defaultdict(list)
+        self._calls = defaultdict(int)
+        for file_name in sorted(glob(os.path.join(path, '*.jsonl.gz'))):
+            exchange_name = os.path.basename(file_name)[:-len('.jsonl.gz')]
+            for record in self._read(file_name):
+                key = request_key(record['method'], record['url'], record['data'])
+                # kept serialized, parsing is a part of the replayed request as with aiohttp
+                self._responses[exchange_name, key].append(json.dumps(record['response']))
+
+    @staticmethod
+    def _read(file_name):
+        with gzip.open(file_name, 'rt') as f:
+            try:
+                for line in f:
+                    yield json.loads(line)
+            except EOFError:  # recording process was killed, flushed records are complete
+                pass
+
+    @property
+    def exchange_names(self):
+        return sorted({exchange_name for exchange_name, _ in self._responses})
+
+    async def request(self, exchange_name: str, method: str, url: str, data: dict = None) -> dict:
+        url, data = redact(url, data)
+        key = exchange_name, request_key(method, url, data)
+        responses = self._responses.get(key)
+        if not responses:
+            raise NotRecordedException(f'There is no recorded response to {method.upper()} {url} at {exchange_name!r}.')
+        call = self._calls[key]
+        self._calls[key] += 1
+        return json.loads(responses[call % len(responses)])
@@ -5,56 +5,85 @@ from aiotg import Bot
 
 import db
 import settings
-from exchanges import exchange_apis
+from exchanges import exchange_specs
 from exchanges.base import state_text
 from exchanges.exceptions import BaseExchangeException
 
 
+async def fetch_orders(api, uid, order_ids):
+    '''Yields orders info by batches of `api.order_info_batch_size`, failed batches are logged and skipped.'''
+    batch_size = api.order_info_batch_size
+    for i in range(0, len(order_ids), batch_size):
+        batch = order_ids[i:i + batch_size]
+        try:
+            yield await api.orders_info(batch)
+        except BaseExchangeException as e:
+            getLogger().error(
+                f'Error while fetching orders {", ".join(batch)} of user id {uid} '
+                f'at exchange {api.name!r}, skipping...'
+            )
+            getLogger().exception(e)
+
+
+def changed_orders(orders, known_orders):
+    '''Returns orders which state or executed amount differs from `known_orders`, {order_id: (state, executed)}.'''
+    return [order for order in orders if known_orders.get(order.order_id) != (order.state, order.executed)]
+
+
+def order_rows(uid, orders):
+    return [(uid, order.exchange_id, order.order_id, order.state.value, order.executed) for order in orders]
+
+
 class OrderChecker:
     bot = Bot(settings.BOT_TOKEN)
 
+    def __init__(self, exchange_ids=None):
+        self.exchange_ids = exchange_ids  # poll only these exchanges, all if None
+
     async def check(self):
         uids = await db.get_uids()
         for uid in uids:
-            for exchange_api in exchange_apis:
-                exchange_id, exchange_name = exchange_api.api_id, exchange_api.name
+            for spec in exchange_specs():
+                if self.exchange_ids is not None and spec.api_id not in self.exchange_ids:
+                    continue
+                exchange_id, exchange_name = spec.api_id, spec.name
 
                 api_key, secret_key = await db.get_keys(uid, exchange_id)
                 if not api_key or not secret_key:
                     continue
-                api = exchange_api(api_key, secret_key)
+                api = spec.load()(api_key, secret_key)
 
                 db_orders = await db.get_order_ids(exchange_id, uid)
                 try:
                     api_orders = await api.order_history()
+                    open_orders = await api.open_orders()
                 except BaseExchangeException as e:
                     getLogger().error(f'Error while parsing exchange {exchange_name!r} of user id {uid}, skipping...')
                     getLogger().exception(e)
                     continue
 
                 new_orders = api_orders - db_orders
+                pending_orders = await db.get_pending_orders(exchange_id, uid)
+                # placed since the last check or known before state tracking, tracked without notification
+                untracked_orders = open_orders - new_orders - pending_orders.keys()
 
-                if not new_orders:
-                    getLogger().info(f'There is no new orders of user id {uid} at exchange {exchange_name!r} '
-                                     f'with id {exchange_id}.')
+                if not new_orders and not pending_orders and not untracked_orders:
+                    getLogger().info(f'There is no new or active orders of user id {uid} '
+                                     f'at exchange {exchange_name!r} with id {exchange_id}.')
                     continue
 
-                await db.add_orders((uid, exchange_id, order_id) for order_id in new_orders)
-
-                for order_id in new_orders:
-                    try:
-                        order = await api.order_info(order_id)
-                    except BaseExchangeException as e:
-                        getLogger().error(
-                            f'Error while fetching order {order_id!r} of user id {uid} '
-                            f'at exchange {exchange_name!r}, skipping...'
-                        )
-                        getLogger().exception(e)
-                        continue
-                    state = state_text[order.state]
-                    getLogger().info(f'Order {order_id} of user {uid} at exchange {exchange_name!r} '
-                                     f'with id {exchange_id} is {state}.')
-                    await self.send_message(uid, api.format_order(order))
+                # orders are saved once fetched, so failed batches are fetched again by the next check
+                async for orders in fetch_orders(api, uid, sorted(untracked_orders)):
+                    await db.save_orders_state(order_rows(uid, orders))
+
+                async for orders in fetch_orders(api, uid, sorted(new_orders) + sorted(pending_orders)):
+                    orders = changed_orders(orders, pending_orders)
+                    await db.save_orders_state(order_rows(uid, orders))
+                    for order in orders:
+                        state = state_text[order.state]
+                        getLogger().info(f'Order {order.order_id} of user {uid} at exchange {exchange_name!r} '
+                                         f'with id {exchange_id} is {state}.')
+                        await self.send_message(uid, api.format_order(order))
 
     async def periodic(self, interval=None):
         while True:
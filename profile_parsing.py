@@ -0,0 +1,117 @@
+'''Records exchange responses and profiles their parsing and formatting offline.
+
+Record responses with read only keys (needs network access):
+
+    python profile_parsing.py record recordings kraken api_key secret_key
+
+The bot records responses too if NOTIFY_BOT_RECORD_DIR is set.
+Replay them at full speed under cProfile and tracemalloc:
+
+    python profile_parsing.py replay recordings --iterations 100 --output parsing.prof
+
+No database or telegram access is made, but the bot settings are imported, so
+NOTIFY_BOT_TOKEN, DATABASE_URL, NOTIFY_BOT_CHECK_INTERVAL and NOTIFY_BOT_ATTEMPTS_LIMIT
+must be set, to any values.
+'''
+import argparse
+import asyncio
+import cProfile
+import pstats
+import tracemalloc
+from logging import getLogger
+
+from exchanges import get_api_by_name
+from exchanges.exceptions import BaseExchangeException
+from exchanges.replay import Recorder, ReplayTransport
+from order_checker import fetch_orders
+
+REPLAY_KEY = 'replay'
+REPLAY_SECRET = 'A' * 86 + '=='  # signing needs a valid base64 secret at kraken
+
+
+async def fetch_all_orders(api):
+    try:
+        order_ids = sorted(await api.order_history())
+    except BaseExchangeException as e:
+        getLogger().error(f'Error while fetching order history at exchange {api.name!r}, skipping...')
+        getLogger().exception(e)
+        return []
+    orders = []
+    async for batch in fetch_orders(api, None, order_ids):
+        orders.extend(batch)
+    return orders
+
+
+async def replay(apis, iterations):
+    for _ in range(iterations):
+        for api in apis:
+            for order in await fetch_all_orders(api):
+                api.format_order(order)
+
+
+def record(args):
+    exchange_api = get_api_by_name(args.exchange)
+    if not exchange_api:
+        raise SystemExit(f'Unsupported exchange {args.exchange!r}.')
+    api = exchange_api(args.api_key, args.secret_key)
+    api.recorder = Recorder(args.path)
+    orders = asyncio.get_event_loop().run_until_complete(fetch_all_orders(api))
+    api.recorder.close()
+    print(f'Recorded {len(orders)} orders of exchange {args.exchange!r} to {args.path}.')
+
+
+def profile(args):
+    transport = ReplayTransport(args.path)
+    apis = []
+    for exchange_name in transport.exchange_names:
+        exchange_api = get_api_by_name(exchange_name)
+        if not exchange_api:
+            getLogger().warning(f'Unsupported exchange {exchange_name!r} in {args.path}, skipping...')
+            continue
+        api = exchange_api(REPLAY_KEY, REPLAY_SECRET)
+        api.transport = transport
+        apis.append(api)
+    loop = asyncio.get_event_loop()
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    loop.run_until_complete(replay(apis, args.iterations))
+    profiler.disable()
+    if args.output:
+        profiler.dump_stats(args.output)
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(args.limit)
+
+    # separate run, tracing allocations skews timings
+    tracemalloc.start()
+    loop.run_until_complete(replay(apis, args.iterations))
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    for stat in snapshot.statistics('lineno')[:args.limit]:
+        print(stat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    record_parser = subparsers.add_parser('record', help='record exchange responses')
+    record_parser.add_argument('path', help='recordings directory')
+    record_parser.add_argument('exchange')
+    record_parser.add_argument('api_key')
+    record_parser.add_argument('secret_key')
+    record_parser.set_defaults(func=record)
+
+    replay_parser = subparsers.add_parser('replay', help='profile parsing of recorded responses')
+    replay_parser.add_argument('path', help='recordings directory')
+    replay_parser.add_argument('--iterations', type=int, default=100)
+    replay_parser.add_argument('--output', help='cProfile stats file')
+    replay_parser.add_argument('--limit', type=int, default=25, help='number of printed stats lines')
+    replay_parser.set_defaults(func=profile)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
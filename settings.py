@@ -6,5 +6,10 @@ BOT_NAME = 'OrdersNotifyBot'
 DATABASE_URL = os.environ['DATABASE_URL']
 
 CHECK_INTERVAL = int(os.environ['NOTIFY_BOT_CHECK_INTERVAL'])  # seconds
+# comma separated ids of exchanges polled by this process, all if not set
+CHECK_EXCHANGE_IDS = {int(i) for i in os.environ['NOTIFY_BOT_EXCHANGE_IDS'].split(',')} \
+    if os.environ.get('NOTIFY_BOT_EXCHANGE_IDS') else None
 
 REQUEST_ATTEMPTS_LIMIT = int(os.environ['NOTIFY_BOT_ATTEMPTS_LIMIT'])
+
+RECORD_DIR = os.environ.get('NOTIFY_BOT_RECORD_DIR')  # exchange responses are recorded there if set
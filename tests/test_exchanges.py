@@ -0,0 +1,65 @@
+import os
+import unittest
+
+for name, value in (('NOTIFY_BOT_TOKEN', 'token'), ('DATABASE_URL', 'postgres://localhost/test'),
+                    ('NOTIFY_BOT_CHECK_INTERVAL', '60'), ('NOTIFY_BOT_ATTEMPTS_LIMIT', '1')):
+    os.environ.setdefault(name, value)
+
+import exchanges  # noqa: E402
+from exchanges import ExchangeSpec, exchange_specs, get_api_by_id, get_api_by_name, get_supported_info  # noqa: E402
+from exchanges.bittrex import BittrexApi  # noqa: E402
+
+
+class FakeApi:
+    name = 'fake'
+    api_id = 100
+    url = 'https://example.com/'
+
+
+class RegistryTest(unittest.TestCase):
+    def register_fake(self, spec):
+        exchanges.register(spec)
+
+        def unregister():
+            del exchanges._by_name[spec.name]
+            del exchanges._by_id[spec.api_id]
+            exchanges._supported_info = None
+
+        self.addCleanup(unregister)
+
+    def test_builtin_specs_match_classes(self):
+        for spec in exchange_specs():
+            api = spec.load()
+            self.assertEqual((api.name, api.api_id, api.url), (spec.name, spec.api_id, spec.url))
+
+    def test_spec_mismatch(self):
+        spec = ExchangeSpec('bittrex', 200, BittrexApi.url, 'exchanges.bittrex:BittrexApi')
+        with self.assertRaises(ValueError):
+            spec.load()
+
+    def test_get_api(self):
+        self.assertIs(get_api_by_name('bittrex'), BittrexApi)
+        self.assertIs(get_api_by_id(BittrexApi.api_id), BittrexApi)
+        self.assertIsNone(get_api_by_name('unknown'))
+        self.assertIsNone(get_api_by_id(0))
+
+    def test_duplicate_registration(self):
+        with self.assertRaises(ValueError):
+            exchanges.register(ExchangeSpec('bittrex', 200, BittrexApi.url))
+        with self.assertRaises(ValueError):
+            exchanges.register(ExchangeSpec('other', BittrexApi.api_id, BittrexApi.url))
+        self.assertIs(get_api_by_id(BittrexApi.api_id), BittrexApi)
+
+    def test_register_api(self):
+        self.assertNotIn('[fake]', get_supported_info())
+        self.register_fake(ExchangeSpec(FakeApi.name, FakeApi.api_id, FakeApi.url, api=FakeApi))
+        self.assertIs(get_api_by_name('fake'), FakeApi)
+        self.assertIs(get_api_by_id(FakeApi.api_id), FakeApi)
+        self.assertIn('[fake](https://example.com/)', get_supported_info())
+
+    def test_supported_info(self):
+        self.assertEqual(get_supported_info().split('\n'), [f'[{spec.name}]({spec.url})' for spec in exchange_specs()])
+
+
+if __name__ == '__main__':
+    unittest.main()
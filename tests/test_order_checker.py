@@ -0,0 +1,149 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+for name, value in (('NOTIFY_BOT_TOKEN', 'token'), ('DATABASE_URL', 'postgres://localhost/test'),
+                    ('NOTIFY_BOT_CHECK_INTERVAL', '60'), ('NOTIFY_BOT_ATTEMPTS_LIMIT', '1')):
+    os.environ.setdefault(name, value)
+
+import order_checker  # noqa: E402
+from db import pending_states  # noqa: E402
+from exchanges import ExchangeSpec  # noqa: E402
+from exchanges.base import Order, State  # noqa: E402
+from exchanges.exceptions import BaseExchangeException  # noqa: E402
+
+UID, EXCHANGE_ID = 1, 100
+
+
+class FakeApi:
+    name = 'fake'
+    api_id = EXCHANGE_ID
+    url = 'https://example.com/'
+    order_info_batch_size = 2
+
+    history = set()
+    open = set()
+    orders = {}
+    failures = 0  # number of next orders_info calls to fail
+
+    def __init__(self, key, secret):
+        pass
+
+    async def order_history(self):
+        return set(self.history)
+
+    async def open_orders(self):
+        return set(self.open)
+
+    async def orders_info(self, order_ids):
+        if FakeApi.failures:
+            FakeApi.failures -= 1
+            raise BaseExchangeException('batch failed')
+        return [self.orders[order_id] for order_id in order_ids]
+
+    def format_order(self, order):
+        return order.order_id
+
+
+class FakeDb:
+    '''Keeps user_order rows of one user, {order_id: (state value or None, executed)}.'''
+
+    def __init__(self):
+        self.rows = {}
+
+    async def get_uids(self):
+        return [UID]
+
+    async def get_keys(self, uid, exchange_id):
+        return 'key', 'secret'
+
+    async def get_order_ids(self, exchange_id, uid):
+        return set(self.rows)
+
+    async def get_pending_orders(self, exchange_id, uid):
+        return {
+            order_id: (State(state), executed)
+            for order_id, (state, executed) in self.rows.items() if state in pending_states
+        }
+
+    async def save_orders_state(self, orders):
+        for uid, exchange_id, order_id, state, executed in orders:
+            self.rows[order_id] = state, executed
+
+
+def order(order_id, state, executed=0.0):
+    return Order(EXCHANGE_ID, order_id, 'buy', 'BTC-ETH', 0.1, 10.0, state, executed)
+
+
+class OrderCheckerTest(unittest.TestCase):
+    def setUp(self):
+        self.db = FakeDb()
+        self.sent = []
+        FakeApi.history, FakeApi.open, FakeApi.orders, FakeApi.failures = set(), set(), {}, 0
+        spec = ExchangeSpec(FakeApi.name, FakeApi.api_id, FakeApi.url, api=FakeApi)
+        for target, attr, value in ((order_checker, 'db', self.db), (order_checker, 'exchange_specs', lambda: [spec])):
+            patcher = mock.patch.object(target, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.checker = order_checker.OrderChecker()
+
+        async def send_message(uid, order_info):
+            self.sent.append(order_info)
+
+        self.checker.send_message = send_message
+
+    def check(self):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.checker.check())
+        loop.close()
+
+    def test_new_order(self):
+        FakeApi.history = {'1'}
+        FakeApi.orders = {'1': order('1', State.EXECUTED, 10.0)}
+        self.check()
+        self.assertEqual(self.sent, ['1'])
+        self.assertEqual(self.db.rows, {'1': (State.EXECUTED.value, 10.0)})
+
+    def test_failed_batch_is_fetched_again(self):
+        FakeApi.history = {'1', '2', '3'}
+        FakeApi.orders = {order_id: order(order_id, State.EXECUTED, 10.0) for order_id in FakeApi.history}
+        FakeApi.failures = 1
+        self.check()
+        self.assertEqual(self.sent, ['3'])
+        self.assertEqual(set(self.db.rows), {'3'})
+
+        self.check()
+        self.assertEqual(self.sent, ['3', '1', '2'])
+        self.assertEqual(set(self.db.rows), {'1', '2', '3'})
+
+    def test_open_order_is_tracked_without_notification(self):
+        FakeApi.open = {'1'}
+        FakeApi.orders = {'1': order('1', State.ACTIVE)}
+        self.check()
+        self.assertEqual(self.sent, [])
+        self.assertEqual(self.db.rows, {'1': (State.ACTIVE.value, 0.0)})
+
+        FakeApi.orders = {'1': order('1', State.ACTIVE, 4.0)}
+        self.check()
+        self.assertEqual(self.sent, ['1'])
+
+        FakeApi.open, FakeApi.history = set(), {'1'}
+        FakeApi.orders = {'1': order('1', State.EXECUTED, 10.0)}
+        self.check()
+        self.check()
+        self.assertEqual(self.sent, ['1', '1'])
+        self.assertEqual(self.db.rows, {'1': (State.EXECUTED.value, 10.0)})
+
+    def test_open_order_known_before_state_tracking(self):
+        self.db.rows = {'1': (None, None)}
+        FakeApi.history = FakeApi.open = {'1'}
+        FakeApi.orders = {'1': order('1', State.ACTIVE, 4.0)}
+        self.check()
+        self.assertEqual(self.sent, [])
+        self.assertEqual(self.db.rows, {'1': (State.ACTIVE.value, 4.0)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import unittest
+
+for name, value in (('NOTIFY_BOT_TOKEN', 'token'), ('DATABASE_URL', 'postgres://localhost/test'),
+                    ('NOTIFY_BOT_CHECK_INTERVAL', '60'), ('NOTIFY_BOT_ATTEMPTS_LIMIT', '1')):
+    os.environ.setdefault(name, value)
+
+from exchanges.base import Order, State  # noqa: E402
+from exchanges.bittrex import BittrexApi  # noqa: E402
+from order_checker import changed_orders  # noqa: E402
+
+
+def bittrex_order(closed=None, cancel_initiated=False, quantity=10.0, quantity_remaining=10.0):
+    return {
+        'Closed': closed,
+        'CancelInitiated': cancel_initiated,
+        'Quantity': quantity,
+        'QuantityRemaining': quantity_remaining,
+    }
+
+
+def order(state, executed=0.0, order_id='1'):
+    return Order(2, order_id, 'buy', 'BTC-ETH', 0.1, 10.0, state, executed)
+
+
+class BittrexOrderStateTest(unittest.TestCase):
+    def test_active(self):
+        self.assertEqual(BittrexApi._order_state(bittrex_order()), State.ACTIVE)
+
+    def test_partially_filled_active(self):
+        self.assertEqual(BittrexApi._order_state(bittrex_order(quantity_remaining=4.0)), State.ACTIVE)
+
+    def test_executed(self):
+        state = BittrexApi._order_state(bittrex_order(closed='2017-10-01T10:00:00', quantity_remaining=0.0))
+        self.assertEqual(state, State.EXECUTED)
+
+    def test_canceled_partially_filled(self):
+        state = BittrexApi._order_state(
+            bittrex_order(closed='2017-10-01T10:00:00', cancel_initiated=True, quantity_remaining=4.0)
+        )
+        self.assertEqual(state, State.CANCELED_PARTIALLY_FILLED)
+
+
+class ChangedOrdersTest(unittest.TestCase):
+    def test_new_order(self):
+        orders = [order(State.ACTIVE)]
+        self.assertEqual(changed_orders(orders, {}), orders)
+
+    def test_unchanged_order(self):
+        self.assertEqual(changed_orders([order(State.ACTIVE, 4.0)], {'1': (State.ACTIVE, 4.0)}), [])
+
+    def test_partial_fill(self):
+        orders = [order(State.ACTIVE, 6.0)]
+        self.assertEqual(changed_orders(orders, {'1': (State.ACTIVE, 4.0)}), orders)
+
+    def test_executed(self):
+        orders = [order(State.EXECUTED, 10.0)]
+        self.assertEqual(changed_orders(orders, {'1': (State.ACTIVE, 4.0)}), orders)
+
+    def test_executed_defaults_to_zero(self):
+        self.assertEqual(Order(2, '1', 'buy', 'BTC-ETH', 0.1, 10.0, State.ACTIVE).executed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
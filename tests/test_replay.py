@@ -0,0 +1,101 @@
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from exchanges.exceptions import NotRecordedException
+from exchanges.replay import REDACTED, Recorder, ReplayTransport, redact
+
+BITTREX_URL = 'https://bittrex.com/api/v1.1/account/getorder?uuid=u1&apikey=secret-key&nonce=1508000000000'
+KRAKEN_URL = 'https://api.kraken.com/0/private/QueryOrders'
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class RedactTest(unittest.TestCase):
+    def test_bittrex_url(self):
+        url, data = redact(BITTREX_URL)
+        self.assertEqual(url, 'https://bittrex.com/api/v1.1/account/getorder?uuid=u1&apikey=%2A%2A%2A')
+        self.assertNotIn('secret-key', url)
+        self.assertNotIn('nonce', url)
+        self.assertEqual(data, {})
+
+    def test_data_nonce(self):
+        kraken_data = {'txid': 'A,B', 'nonce': 1508000000000}
+        liqui_data = {'method': 'OrderInfo', 'order_id': '1', 'nonce': 1508000000}
+        for data in (kraken_data, liqui_data):
+            url, redacted = redact(KRAKEN_URL, data)
+            self.assertEqual(url, KRAKEN_URL)
+            self.assertNotIn('nonce', redacted)
+            self.assertEqual(redacted, {k: v for k, v in data.items() if k != 'nonce'})
+
+    def test_apikey_in_data(self):
+        self.assertEqual(redact(KRAKEN_URL, {'apikey': 'secret-key'})[1], {'apikey': REDACTED})
+
+
+class RecordReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'recordings')
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.path))
+
+    def record(self, *records):
+        recorder = Recorder(self.path)
+        for record in records:
+            run(recorder.write(*record))
+        recorder.close()
+
+    def test_records_are_redacted(self):
+        self.record(('bittrex', 'GET', BITTREX_URL, None, {'success': True}))
+        with gzip.open(os.path.join(self.path, 'bittrex.jsonl.gz'), 'rt') as f:
+            content = f.read()
+        self.assertNotIn('secret-key', content)
+        self.assertNotIn('nonce', content)
+        self.assertEqual(json.loads(content)['response'], {'success': True})
+
+    def test_replay_with_other_nonce_and_key(self):
+        self.record(('bittrex', 'GET', BITTREX_URL, None, {'success': True}))
+        url = BITTREX_URL.replace('secret-key', 'other-key').replace('1508000000000', '1509000000000')
+        self.assertEqual(run(ReplayTransport(self.path).request('bittrex', 'get', url)), {'success': True})
+
+    def test_replay_txids_in_other_order(self):
+        response = {'error': [], 'result': {'A': {}, 'B': {}}}
+        self.record(('kraken', 'post', KRAKEN_URL, {'txid': 'A,B', 'nonce': 1}, response))
+        transport = ReplayTransport(self.path)
+        self.assertEqual(run(transport.request('kraken', 'POST', KRAKEN_URL, {'txid': 'B,A', 'nonce': 2})), response)
+
+    def test_repeated_responses_are_cycled(self):
+        data = {'method': 'ActiveOrders', 'nonce': 1}
+        self.record(*(('liqui', 'post', 'https://api.liqui.io/tapi', data, {'return': {str(i): {}}}) for i in range(2)))
+        transport = ReplayTransport(self.path)
+        responses = [run(transport.request('liqui', 'post', 'https://api.liqui.io/tapi', data)) for _ in range(3)]
+        self.assertEqual(responses, [{'return': {'0': {}}}, {'return': {'1': {}}}, {'return': {'0': {}}}])
+
+    def test_replayed_responses_are_copies(self):
+        self.record(('kraken', 'get', KRAKEN_URL, None, {'result': {'A': {}}}))
+        transport = ReplayTransport(self.path)
+        run(transport.request('kraken', 'get', KRAKEN_URL))['result'].popitem()
+        self.assertEqual(run(transport.request('kraken', 'get', KRAKEN_URL)), {'result': {'A': {}}})
+
+    def test_replay_while_recording(self):
+        recorder = Recorder(self.path)
+        self.addCleanup(recorder.close)
+        run(recorder.write('bittrex', 'GET', BITTREX_URL, None, {'success': True}))
+        self.assertEqual(run(ReplayTransport(self.path).request('bittrex', 'get', BITTREX_URL)), {'success': True})
+
+    def test_not_recorded(self):
+        self.record(('bittrex', 'GET', BITTREX_URL, None, {'success': True}))
+        with self.assertRaises(NotRecordedException):
+            run(ReplayTransport(self.path).request('bittrex', 'get', BITTREX_URL.replace('u1', 'u2')))
+
+
+if __name__ == '__main__':
+    unittest.main()